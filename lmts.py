@@ -7,6 +7,9 @@ Features:
  - Hotkey recorder (press keys to capture) and global registration via keyboard
  - Auto-start (HKCU Run) toggle
  - Auto-stop after user-specified runtime (when stream started)
+ - Optional DSP worker thread (processing runs one or two blocks ahead of the
+   callback, see dsp_buffers)
+ - Optional local metrics (Prometheus endpoint on localhost + JSON-lines file)
  - Tray icon with toggle/settings/exit
  - Config file stored on system drive or AppData when frozen
 """
@@ -16,7 +19,12 @@ import os
 import json
 import time
 import threading
+import queue
+import bisect
+import socket
+from http.server import HTTPServer, BaseHTTPRequestHandler
 
+import numpy as np
 import sounddevice as sd
 import keyboard
 import winreg
@@ -42,6 +50,8 @@ else:
 
 os.makedirs(CONFIG_DIR, exist_ok=True)
 CONFIG_FILE = os.path.join(CONFIG_DIR, 'audio_config.json')
+METRICS_FILE = os.path.join(CONFIG_DIR, 'metrics.jsonl')
+METRICS_FILE_MAX_BYTES = 5 * 1024 * 1024  # rolled over to metrics.jsonl.1 past this
 
 # -------------------------
 # Globals and locks
@@ -52,6 +62,12 @@ tray_icon = None
 mute_state = False
 hotkey_handle = None
 
+# DSP worker of the running stream (None when processing runs in the callback)
+dsp_worker = None
+
+# Local metrics exporter (None when disabled)
+metrics_exporter = None
+
 # Timer for auto-stop (when user starts stream)
 auto_stop_timer = None
 auto_stop_lock = threading.Lock()
@@ -114,7 +130,12 @@ def load_config():
             'samplerate': 44100,
             'autostart': False,
             'hotkey': 'ctrl+m',
-            'auto_stop_minutes': 0  # 0 = disabled
+            'auto_stop_minutes': 0,  # 0 = disabled
+            'dsp_offload': False,
+            'dsp_buffers': 2,  # 2 = double (1 block lookahead), 3 = triple (2 blocks)
+            'metrics_enabled': False,
+            'metrics_port': 9464,
+            'metrics_interval': 15  # seconds between JSON-lines records, 0 = disabled
         }
 
 # -------------------------
@@ -194,11 +215,273 @@ def _cancel_auto_stop_timer():
             auto_stop_timer = None
             print("[auto_stop] timer canceled")
 
+# -------------------------
+# Stream statistics (updated from the audio callback, lock-free)
+# -------------------------
+# upper bounds (seconds) of the callback duration histogram buckets
+CALLBACK_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+class StreamStats:
+    """
+    Counters shared between the audio callback and the metrics exporter.
+
+    Every field has a single writer and readers never lock: a snapshot may be
+    a block out of date, which is fine for monitoring and keeps the callback
+    free of any lock.
+    """
+
+    def __init__(self):
+        self.process_started_at = time.time()
+        self.stream_started_at = None
+        self.stream_info = {}
+        self.starts = 0
+        self.stops = 0
+        self.start_failures = 0
+        self.callbacks = 0
+        self.xruns = {
+            'input_underflow': 0, 'input_overflow': 0,
+            'output_underflow': 0, 'output_overflow': 0,
+        }
+        # one slot per bucket plus +Inf; counts are per bucket, not cumulative
+        self.callback_buckets = [0] * (len(CALLBACK_BUCKETS) + 1)
+        self.callback_seconds = 0.0
+
+    def record_status(self, status):
+        for flag in self.xruns:
+            if getattr(status, flag, False):
+                self.xruns[flag] += 1
+
+    def record_callback(self, seconds):
+        self.callbacks += 1
+        self.callback_seconds += seconds
+        self.callback_buckets[bisect.bisect_left(CALLBACK_BUCKETS, seconds)] += 1
+
+    def stream_started(self, info):
+        self.stream_info = info
+        self.stream_started_at = time.time()
+        self.starts += 1
+
+    def stream_stopped(self):
+        self.stream_started_at = None
+        self.stops += 1
+
+stream_stats = StreamStats()
+
+# -------------------------
+# DSP worker (block processing off the audio callback)
+# -------------------------
+def _route_channels(src, outdata):
+    """Copy `src` into `outdata`, padding with silence or dropping extra channels."""
+    try:
+        in_ch = src.shape[1]
+        out_ch = outdata.shape[1]
+    except Exception:
+        outdata[:] = src
+        return
+    if in_ch == out_ch:
+        outdata[:] = src
+    elif in_ch < out_ch:
+        outdata[:, :in_ch] = src
+        outdata[:, in_ch:] = 0
+    else:
+        outdata[:] = src[:, :out_ch]
+
+# GIL switch interval while the DSP worker runs. The worker shares the GIL
+# with the audio callback; at the 5 ms default a busy worker could keep the
+# callback out of the interpreter for longer than a whole block.
+DSP_SWITCH_INTERVAL = 0.0005
+
+# window (seconds) over which the DSP worker's utilization is reported
+DSP_UTILIZATION_WINDOW = 1.0
+
+def dsp_process(block):
+    """
+    Heavy per-block processing (denoise, EQ, ...). Runs on the DSP worker
+    thread, never in the audio callback. Must return an array shaped like
+    `block`. Pass-through by default. `block` is the worker's own scratch
+    copy, so it may be modified in place.
+
+    Keep the work in numpy/native calls that release the GIL (np.fft, ufuncs
+    on whole blocks, ...). Per-sample Python loops hold the GIL and still
+    starve the callback, even with the shortened switch interval.
+    """
+    return block
+
+class DspWorker:
+    """
+    Runs dsp_process() on a dedicated thread `buffers - 1` blocks behind the
+    callback.
+
+    The callback only copies the incoming block into a preallocated slot,
+    queues its sequence number and plays the processed result of the block
+    `lookahead` periods earlier. With double buffering the worker gets one
+    block period per block, with triple buffering two; the added latency is
+    fixed at `lookahead` blocks. If that block is not ready in time, the
+    callback plays it dry instead of underrunning.
+
+    That time budget only holds while dsp_process() lets go of the GIL, so
+    the worker lowers sys.setswitchinterval() to DSP_SWITCH_INTERVAL while it
+    runs and restores the previous value on stop().
+    """
+
+    def __init__(self, blocksize, channels, samplerate, buffers=2):
+        try:
+            buffers = int(buffers)
+        except Exception:
+            buffers = 2
+        self.buffers = min(max(buffers, 2), 3)
+        self.blocksize = int(blocksize)
+        self.samplerate = float(samplerate)
+        self.lookahead = self.buffers - 1
+        self.latency_frames = self.blocksize * self.lookahead
+        self.latency_ms = 1000.0 * self.latency_frames / self.samplerate if self.samplerate else 0.0
+
+        self._in = [np.zeros((self.blocksize, channels), dtype='float32') for _ in range(self.buffers)]
+        self._out = [np.zeros((self.blocksize, channels), dtype='float32') for _ in range(self.buffers)]
+        # dsp_process() works on this copy so the dry fallback stays untouched
+        self._scratch = np.zeros((self.blocksize, channels), dtype='float32')
+        # sequence number currently held by each slot (-1 = empty)
+        self._in_seq = [-1] * self.buffers
+        self._out_seq = [-1] * self.buffers
+        self._seq = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._running = False
+        self._prev_switch_interval = None
+
+        # metrics (written by one thread each, read without locking)
+        self.blocks_processed = 0
+        self.missed_deadlines = 0
+        self.busy_seconds = 0.0
+        self.started_at = None
+        self.recent_utilization = 0.0
+        self._window_start = None
+        self._window_busy = 0.0
+
+    def start(self):
+        self._running = True
+        self.started_at = time.perf_counter()
+        self._window_start = self.started_at
+        self._window_busy = 0.0
+        self._prev_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._prev_switch_interval, DSP_SWITCH_INTERVAL))
+        self._thread = threading.Thread(target=self._run, name="DspWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._prev_switch_interval is not None:
+            sys.setswitchinterval(self._prev_switch_interval)
+            self._prev_switch_interval = None
+
+    def utilization(self):
+        """Fraction of wall time the worker spent inside dsp_process() since start()."""
+        if self.started_at is None:
+            return 0.0
+        elapsed = time.perf_counter() - self.started_at
+        return self.busy_seconds / elapsed if elapsed > 0 else 0.0
+
+    def _update_window(self, now):
+        """Refreshes recent_utilization once per DSP_UTILIZATION_WINDOW (worker thread)."""
+        elapsed = now - self._window_start
+        if elapsed >= DSP_UTILIZATION_WINDOW:
+            self.recent_utilization = (self.busy_seconds - self._window_busy) / elapsed
+            self._window_start = now
+            self._window_busy = self.busy_seconds
+
+    def metrics(self):
+        return {
+            'buffers': self.buffers,
+            'lookahead_blocks': self.lookahead,
+            'latency_frames': self.latency_frames,
+            'latency_ms': self.latency_ms,
+            'blocks_processed': self.blocks_processed,
+            'missed_deadlines': self.missed_deadlines,
+            'busy_seconds': self.busy_seconds,
+            'utilization': self.recent_utilization,
+            'utilization_lifetime': self.utilization(),
+        }
+
+    def exchange(self, indata, outdata):
+        """Called from the audio callback: hand over `indata`, emit block `seq - lookahead`."""
+        if indata.shape[0] != self.blocksize:
+            # variable-size block from the host API; keep the audio flowing dry
+            _route_channels(indata, outdata)
+            return
+        seq = self._seq
+        prev = seq - self.lookahead
+        prev_slot = prev % self.buffers
+        if prev < 0:
+            outdata.fill(0)
+        elif self._out_seq[prev_slot] == prev:
+            _route_channels(self._out[prev_slot], outdata)
+        else:
+            self.missed_deadlines += 1
+            _route_channels(self._in[prev_slot], outdata)
+
+        slot = seq % self.buffers
+        self._in_seq[slot] = -1
+        self._in[slot][:] = indata
+        self._in_seq[slot] = seq
+        self._seq = seq + 1
+        self._queue.put(seq)
+
+    def _run(self):
+        while self._running:
+            seq = self._queue.get()
+            if seq is None:
+                break
+            # skip blocks the callback has already played dry
+            if self._seq > seq + self.lookahead:
+                continue
+            slot = seq % self.buffers
+            if self._in_seq[slot] != seq:
+                continue
+            self._scratch[:] = self._in[slot]
+            if self._in_seq[slot] != seq:
+                continue  # slot recycled while copying
+            t0 = time.perf_counter()
+            try:
+                result = dsp_process(self._scratch)
+                self._out[slot][:] = result
+            except Exception as e:
+                print("[dsp] processing error:", e)
+                continue
+            finally:
+                now = time.perf_counter()
+                self.busy_seconds += now - t0
+                self._update_window(now)
+            # publish only if the callback has not played the block dry or
+            # recycled the slot meanwhile, so processed + missed = blocks played
+            if self._seq <= seq + self.lookahead and self._in_seq[slot] == seq:
+                self._out_seq[slot] = seq
+                self.blocks_processed += 1
+
+def _stop_dsp_worker():
+    """Stops the DSP worker of the current stream (if any) and logs its metrics."""
+    global dsp_worker
+    if dsp_worker is None:
+        return
+    dsp_worker.stop()
+    m = dsp_worker.metrics()
+    print(f"[dsp] worker stopped: {m['blocks_processed']} blocks, "
+          f"{m['missed_deadlines']} missed, utilization {m['utilization_lifetime']:.1%}")
+    dsp_worker = None
+
+def get_dsp_metrics():
+    """Returns the running DSP worker's metrics dict, or None when offload is off."""
+    w = dsp_worker
+    return w.metrics() if w is not None else None
+
 # -------------------------
 # Audio stream control
 # -------------------------
 def start_stream():
-    global stream, tray_icon
+    global stream, tray_icon, dsp_worker
     with stream_lock:
         if stream or mute_state:
             return
@@ -207,22 +490,18 @@ def start_stream():
             print("No input/output configured - cannot start stream.")
             return
 
+        worker = None
+
         def callback(indata, outdata, frames, t, status):
+            t0 = time.perf_counter()
             if status:
+                stream_stats.record_status(status)
                 print("Stream status:", status)
-            try:
-                in_ch = indata.shape[1]
-                out_ch = outdata.shape[1]
-            except Exception:
-                outdata[:] = indata
-                return
-            if in_ch == out_ch:
-                outdata[:] = indata
-            elif in_ch < out_ch:
-                outdata[:, :in_ch] = indata
-                outdata[:, in_ch:] = 0
+            if worker is not None:
+                worker.exchange(indata, outdata)
             else:
-                outdata[:] = indata[:, :out_ch]
+                _route_channels(indata, outdata)
+            stream_stats.record_callback(time.perf_counter() - t0)
 
         try:
             stream = sd.Stream(
@@ -232,7 +511,23 @@ def start_stream():
                 blocksize=cfg.get('blocksize', 256),
                 latency='low'
             )
+            if cfg.get('dsp_offload', False) and not stream.blocksize:
+                print("[dsp] offload needs a fixed blocksize - processing in callback")
+            elif cfg.get('dsp_offload', False):
+                worker = DspWorker(stream.blocksize, stream.channels[0],
+                                   stream.samplerate, cfg.get('dsp_buffers', 2))
+                worker.start()
+                dsp_worker = worker
+                print(f"[dsp] worker started, added latency {worker.latency_frames} frames "
+                      f"({worker.latency_ms:.2f} ms)")
             stream.start()
+            stream_stats.stream_started({
+                'input_device': cfg['input_device'],
+                'output_device': cfg['output_device'],
+                'blocksize': stream.blocksize,
+                'samplerate': stream.samplerate,
+                'dsp_offload': worker is not None,
+            })
             if tray_icon:
                 tray_icon.icon = ICON_ACTIVE
             print("[stream] started")
@@ -240,7 +535,14 @@ def start_stream():
             _start_auto_stop_timer(cfg.get('auto_stop_minutes', 0))
         except Exception as e:
             print("Error starting stream:", e)
+            stream_stats.start_failures += 1
+            if stream is not None:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
             stream = None
+            _stop_dsp_worker()
 
 def stop_stream():
     global stream, tray_icon
@@ -252,6 +554,8 @@ def stop_stream():
             except Exception as e:
                 print("Error stopping stream:", e)
             stream = None
+            _stop_dsp_worker()
+            stream_stats.stream_stopped()
             if tray_icon:
                 tray_icon.icon = ICON_IDLE
             print("[stream] stopped")
@@ -266,6 +570,203 @@ def toggle_mute():
     else:
         start_stream()
 
+# -------------------------
+# Local metrics exporter (Prometheus text + JSON-lines)
+# -------------------------
+def collect_metrics():
+    """Snapshot of stream health. Reads shared state only, never takes a lock."""
+    now = time.time()
+    started = stream_stats.stream_started_at
+    return {
+        'timestamp': now,
+        'process_uptime_seconds': now - stream_stats.process_started_at,
+        'stream_active': stream is not None,
+        'stream_uptime_seconds': now - started if started is not None else 0.0,
+        'muted': mute_state,
+        'stream_starts': stream_stats.starts,
+        'stream_stops': stream_stats.stops,
+        'stream_start_failures': stream_stats.start_failures,
+        'callbacks': stream_stats.callbacks,
+        'callback_seconds_sum': stream_stats.callback_seconds,
+        'callback_buckets': list(stream_stats.callback_buckets),
+        'xruns': dict(stream_stats.xruns),
+        'config': dict(stream_stats.stream_info),
+        'dsp': get_dsp_metrics(),
+    }
+
+def format_prometheus(m):
+    """Renders a collect_metrics() snapshot in the Prometheus text format."""
+    lines = []
+
+    def metric(name, mtype, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+        for labels, value in samples:
+            lines.append(f"{name}{labels} {value}")
+
+    metric('lmts_up', 'gauge', 'Metrics exporter is running.', [('', 1)])
+    metric('lmts_process_uptime_seconds', 'gauge', 'Seconds since the app started.',
+           [('', f"{m['process_uptime_seconds']:.3f}")])
+    metric('lmts_stream_active', 'gauge', '1 while the mic-to-speaker stream is running.',
+           [('', int(m['stream_active']))])
+    metric('lmts_stream_uptime_seconds', 'gauge', 'Seconds since the current stream started.',
+           [('', f"{m['stream_uptime_seconds']:.3f}")])
+    metric('lmts_muted', 'gauge', '1 while muted via hotkey.', [('', int(m['muted']))])
+    metric('lmts_stream_starts_total', 'counter', 'Streams started (including restarts).',
+           [('', m['stream_starts'])])
+    metric('lmts_stream_stops_total', 'counter', 'Streams stopped.', [('', m['stream_stops'])])
+    metric('lmts_stream_start_failures_total', 'counter', 'Failed attempts to open a stream.',
+           [('', m['stream_start_failures'])])
+    metric('lmts_xruns_total', 'counter', 'PortAudio xruns reported to the callback.',
+           [(f'{{kind="{k}"}}', v) for k, v in m['xruns'].items()])
+
+    samples = []
+    cumulative = 0
+    for bound, count in zip(CALLBACK_BUCKETS, m['callback_buckets']):
+        cumulative += count
+        samples.append((f'_bucket{{le="{bound}"}}', cumulative))
+    cumulative += m['callback_buckets'][-1]
+    samples.append(('_bucket{le="+Inf"}', cumulative))
+    samples.append(('_sum', f"{m['callback_seconds_sum']:.6f}"))
+    # _count must equal the +Inf bucket; `callbacks` is updated separately and may lag
+    samples.append(('_count', cumulative))
+    metric('lmts_callback_duration_seconds', 'histogram', 'Time spent in the audio callback.', samples)
+
+    cfg = m['config']
+    if cfg:
+        labels = ",".join(f'{k}="{cfg.get(k)}"' for k in ('input_device', 'output_device'))
+        metric('lmts_stream_info', 'gauge', 'Devices of the last started stream.',
+               [(f'{{{labels}}}', 1)])
+        metric('lmts_stream_blocksize_frames', 'gauge', 'Blocksize of the last started stream.',
+               [('', cfg.get('blocksize'))])
+        metric('lmts_stream_samplerate_hz', 'gauge', 'Sample rate of the last started stream.',
+               [('', cfg.get('samplerate'))])
+
+    dsp = m['dsp']
+    if dsp:
+        metric('lmts_dsp_latency_seconds', 'gauge', 'Fixed latency added by the DSP worker.',
+               [('', f"{dsp['latency_ms'] / 1000.0:.6f}")])
+        metric('lmts_dsp_blocks_processed_total', 'counter', 'Blocks processed by the DSP worker.',
+               [('', dsp['blocks_processed'])])
+        metric('lmts_dsp_missed_deadlines_total', 'counter', 'Blocks played dry because the worker was late.',
+               [('', dsp['missed_deadlines'])])
+        metric('lmts_dsp_busy_seconds_total', 'counter', 'Time the DSP worker spent processing.',
+               [('', f"{dsp['busy_seconds']:.6f}")])
+        metric('lmts_dsp_utilization_ratio', 'gauge', 'Fraction of time the DSP worker was busy over the last second.',
+               [('', f"{dsp['utilization']:.4f}")])
+
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    # the server is single-threaded: drop idle or half-open clients quickly
+    timeout = 2.0
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = format_prometheus(collect_metrics()).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass  # keep scrapes out of the console
+
+class _MetricsHTTPServer(HTTPServer):
+    # SO_REUSEADDR on Windows lets a second process bind a port in use; a
+    # conflict must fail instead so start_metrics_exporter() reports it
+    allow_reuse_address = False
+
+    def server_bind(self):
+        if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):  # Windows only
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        super().server_bind()
+
+class MetricsExporter:
+    """
+    Serves /metrics on 127.0.0.1:<port> and appends a JSON line to
+    METRICS_FILE every `interval` seconds, rolling it over to METRICS_FILE.1
+    once it exceeds METRICS_FILE_MAX_BYTES. Both run on daemon threads that
+    only read StreamStats and sleep between ticks. They stay at normal priority
+    on purpose: they hold the GIL while running, and a starved low-priority
+    thread holding it would stall the audio callback.
+    """
+
+    def __init__(self, port=9464, interval=15, path=METRICS_FILE):
+        self.port = int(port)
+        self.interval = float(interval or 0)
+        self.path = path
+        self._server = None
+        self._serve_thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        self._server = _MetricsHTTPServer(('127.0.0.1', self.port), _MetricsHandler)
+        # handle_request() returns after this long, so _serve notices stop()
+        self._server.timeout = 0.5
+        self._serve_thread = threading.Thread(target=self._serve, name="MetricsHTTP", daemon=True)
+        self._serve_thread.start()
+        if self.interval > 0:
+            threading.Thread(target=self._write_loop, name="MetricsFile", daemon=True).start()
+        print(f"[metrics] serving http://127.0.0.1:{self.port}/metrics")
+
+    def stop(self):
+        # No HTTPServer.shutdown(): it blocks forever if serve_forever() never ran.
+        self._stop.set()
+        if self._serve_thread is not None:
+            self._serve_thread.join(timeout=self._server.timeout + _MetricsHandler.timeout)
+            self._serve_thread = None
+        if self._server is not None:
+            try:
+                self._server.server_close()
+            except Exception:
+                pass
+            self._server = None
+
+    def _serve(self):
+        server = self._server
+        while not self._stop.is_set():
+            try:
+                server.handle_request()
+            except Exception as e:
+                if not self._stop.is_set():
+                    print("[metrics] request failed:", e)
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if os.path.getsize(self.path) > METRICS_FILE_MAX_BYTES:
+                    os.replace(self.path, self.path + '.1')
+            except OSError:
+                pass  # no file yet
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(collect_metrics()) + "\n")
+            except Exception as e:
+                print("[metrics] failed to write file:", e)
+
+def start_metrics_exporter(cfg):
+    """(Re)starts the exporter according to cfg; stops it when metrics are disabled."""
+    global metrics_exporter
+    stop_metrics_exporter()
+    if not cfg.get('metrics_enabled', False):
+        return
+    try:
+        exporter = MetricsExporter(cfg.get('metrics_port', 9464), cfg.get('metrics_interval', 15))
+        exporter.start()
+        metrics_exporter = exporter
+    except Exception as e:
+        print("[metrics] failed to start exporter:", e)
+
+def stop_metrics_exporter():
+    global metrics_exporter
+    if metrics_exporter is not None:
+        metrics_exporter.stop()
+        metrics_exporter = None
+
 # -------------------------
 # Hotkey management
 # -------------------------
@@ -417,8 +918,8 @@ class SettingsWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LMTS Settings")
-        self.setMinimumSize(360, 300)
-        self.resize(360, 300)
+        self.setMinimumSize(360, 360)
+        self.resize(360, 360)
         self.init_ui()
 
     def init_ui(self):
@@ -457,6 +958,15 @@ class SettingsWindow(QWidget):
         self.autostart.setChecked(cfg.get('autostart', False))
         layout.addWidget(self.autostart)
 
+        self.dsp_offload = QCheckBox("Process audio on worker thread (adds 1-2 blocks latency)")
+        self.dsp_offload.setChecked(cfg.get('dsp_offload', False))
+        layout.addWidget(self.dsp_offload)
+
+        self.metrics_enabled = QCheckBox("Local metrics endpoint (127.0.0.1:%d/metrics)"
+                                         % cfg.get('metrics_port', 9464))
+        self.metrics_enabled.setChecked(cfg.get('metrics_enabled', False))
+        layout.addWidget(self.metrics_enabled)
+
         save_btn = QPushButton("Save")
         save_btn.setMinimumHeight(34)
         save_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -500,6 +1010,9 @@ class SettingsWindow(QWidget):
 
         cfg['hotkey'] = new_hotkey
         cfg['autostart'] = self.autostart.isChecked()
+        cfg['dsp_offload'] = self.dsp_offload.isChecked()
+        metrics_changed = cfg.get('metrics_enabled', False) != self.metrics_enabled.isChecked()
+        cfg['metrics_enabled'] = self.metrics_enabled.isChecked()
         save_config(cfg)
 
         # Apply autostart
@@ -515,6 +1028,9 @@ class SettingsWindow(QWidget):
             QMessageBox.warning(self, "Saved (hotkey failed)",
                                 "Settings saved but could not register hotkey. Try running as Administrator or choose a different combo.")
 
+        if metrics_changed:
+            start_metrics_exporter(cfg)
+
         # If stream running, restart auto-stop timer with new config
         if stream:
             _start_auto_stop_timer(cfg.get('auto_stop_minutes', 0))
@@ -642,6 +1158,7 @@ def create_tray_icon(app_window):
         except Exception:
             pass
         stop_stream()
+        stop_metrics_exporter()
         icon.stop()
         os._exit(0)
 
@@ -682,6 +1199,8 @@ def main():
     # Register initial hotkey (from config)
     run_hotkey()
 
+    start_metrics_exporter(cfg)
+
     sys.exit(app.exec_())
 
 if __name__ == "__main__":